@@ -5,6 +5,8 @@ created for each test case that uses the ``kube`` fixture. The ``kube``
 fixture provides the ``TestClient`` instance to the test case.
 """
 
+from __future__ import annotations
+
 import logging
 from typing import Any, Dict, Optional, Union
 
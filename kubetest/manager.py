@@ -1,5 +1,7 @@
 """Kubetest manager for test client instances and namespace management."""
 
+from __future__ import annotations
+
 import logging
 import os
 from typing import Generator, List, Optional, Union
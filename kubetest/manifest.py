@@ -11,6 +11,13 @@ import kubernetes
 import yaml
 from kubernetes.client import models
 
+# Use the LibYAML based loader when PyYAML was built with LibYAML bindings,
+# as it is significantly faster than the pure-Python loader.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Callable type describing the signature of render() implementations
 Renderer = Callable[[Union[str, TextIO], Dict[str, Any]], Union[str, TextIO]]
 __render__: Optional[Renderer] = None
@@ -98,7 +105,7 @@ def load_file(path: str, *, renderer: Renderer = render) -> List[object]:
     """
     with open(path, "r") as f:
         content = renderer(f, dict(path=path))
-        manifests = yaml.load_all(content, Loader=yaml.SafeLoader)
+        manifests = yaml.load_all(content, Loader=SafeLoader)
 
         objs = []
         for manifest in manifests:
@@ -127,18 +134,39 @@ def load_path(path: str, *, renderer: Renderer = render) -> List[object]:
     Raises:
         ValueError: The provided path is not a directory.
     """
-    if not os.path.isdir(path):
-        raise ValueError(f"{path} is not a directory")
+    files = find_manifest_files(path)
 
     objs = []
     if isinstance(renderer, ContextRenderer):
         renderer.context["objs"] = objs
-    for f in os.listdir(path):
-        if os.path.splitext(f)[1].lower() in [".yaml", ".yml"]:
-            objs = objs + load_file(os.path.join(path, f), renderer=renderer)
+    for f in files:
+        objs.extend(load_file(f, renderer=renderer))
     return objs
 
 
+def find_manifest_files(path: str) -> List[str]:
+    """Find all of the Kubernetes YAML manifest files in the specified
+    directory path.
+
+    Args:
+        path: The path to the directory of manifest files.
+
+    Returns:
+        The paths of the YAML manifest files found in the directory.
+
+    Raises:
+        ValueError: The provided path is not a directory.
+    """
+    if not os.path.isdir(path):
+        raise ValueError(f"{path} is not a directory")
+
+    return [
+        os.path.join(path, f)
+        for f in os.listdir(path)
+        if os.path.splitext(f)[1].lower() in [".yaml", ".yml"]
+    ]
+
+
 def get_type(manifest: Dict[str, Any]) -> Union[object, None]:
     """Get the Kubernetes object type from the manifest kind and version.
 
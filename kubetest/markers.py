@@ -1,13 +1,22 @@
 """Custom pytest markers for kubetest."""
 
+import copy
+import functools
+import itertools
 import os
-from typing import List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
 
 import pytest
 from kubernetes import client
 
-from kubetest import manager
-from kubetest.manifest import ContextRenderer, Renderer, load_file, load_path, render
+from kubetest import manager, manifest, objects
+from kubetest.manifest import (
+    ContextRenderer,
+    Renderer,
+    find_manifest_files,
+    load_file,
+    render,
+)
 from kubetest.objects import ApiObject, ClusterRoleBinding, RoleBinding
 
 APPLYMANIFEST_INI = (
@@ -22,11 +31,13 @@ APPLYMANIFEST_INI = (
 )
 
 APPLYMANIFESTS_INI = (
-    "applymanifests(dir, files=None, render=None): "
+    "applymanifests(dir, files=None, render=None, expose_objs=False): "
     "load YAML manifests from the specified path and create them on the cluster. "
     "By default, all YAML files found in the specified path will be loaded and created. "
     "If a list is passed to the files parameter, only the files in the path matching "
-    "a name in the files list will be loaded and created. This marker is similar to "
+    "a name in the files list will be loaded and created. If expose_objs is True, the "
+    "objects loaded from previous files are made available to the templates of "
+    'subsequent files via the "objs" render context variable. This marker is similar to '
     'the "kubectl apply -f <dir>" command. Loading manifests via this marker will not '
     'prohibit you from loading other manifests manually. Use the "kube" fixture to get '
     "references to the created objects. Manifests loaded via this marker are registered "
@@ -83,6 +94,30 @@ NAMESPACE_INI = (
     "the name of the namespace to create/use."
 )
 
+# A mapping of Kubernetes resource kinds to the kubetest wrapper class for that
+# kind. This is built lazily on first use and cached; see `_get_kind_to_class`.
+_KIND_TO_CLASS: Optional[Dict[str, Type[ApiObject]]] = None
+
+# The (name, kind) of the default RBAC subjects used when a rolebinding or
+# clusterrolebinding marker does not specify a subject.
+_DEFAULT_SUBJECTS = (
+    # all authenticated users
+    ("system:authenticated", "Group"),
+    # all unauthenticated users
+    ("system:unauthenticated", "Group"),
+    # all service accounts
+    ("system:serviceaccounts", "Group"),
+)
+
+# The API group of the RBAC subjects and role references created by the markers.
+_RBAC_API_GROUP = "rbac.authorization.k8s.io"
+
+# The client configuration passed to the RBAC models created by the markers.
+# Without one, each model constructs a new Configuration, which sets up its
+# loggers and queries the cpu count, and is most of the cost of building the
+# model. The models only use it for their client-side validation setting.
+_MODEL_CONFIGURATION = client.Configuration()
+
 
 def register(config) -> None:
     """Register kubetest markers with pytest.
@@ -98,6 +133,125 @@ def register(config) -> None:
     config.addinivalue_line("markers", NAMESPACE_INI)
 
 
+def _iter_all_subclasses(root: type) -> Iterator[type]:
+    """Iterate over all of the transitive subclasses of the given class.
+
+    Each subclass is yielded exactly once, regardless of how deep in the
+    class hierarchy it is defined.
+
+    Args:
+        root: The class to get the subclasses of.
+
+    Yields:
+        The subclasses of the root class.
+    """
+    stack = [root]
+    seen = set()
+    while stack:
+        cls = stack.pop()
+        for sub_cls in cls.__subclasses__():
+            if sub_cls not in seen:
+                seen.add(sub_cls)
+                stack.append(sub_cls)
+                yield sub_cls
+
+
+def _get_kind_to_class() -> Dict[str, Type[ApiObject]]:
+    """Get the mapping of Kubernetes resource kinds to kubetest wrapper classes.
+
+    The mapping is built from all subclasses of `ApiObject` the first time it is
+    requested and is cached for subsequent calls.
+
+    Returns:
+        A dictionary mapping a resource kind to its kubetest wrapper class.
+    """
+    global _KIND_TO_CLASS
+    if _KIND_TO_CLASS is None:
+        # The kubetest wrappers are loaded lazily, so make sure that they are
+        # all loaded before looking up the ApiObject subclasses.
+        for name in objects.__all__:
+            getattr(objects, name)
+        _KIND_TO_CLASS = {c.__name__: c for c in _iter_all_subclasses(ApiObject)}
+    return _KIND_TO_CLASS
+
+
+def _invalidate_kind_cache() -> None:
+    """Clear the cached kind to wrapper class mapping.
+
+    This should be called if new `ApiObject` wrapper classes are defined after
+    the mapping was first built, so that they are picked up on the next lookup.
+    """
+    global _KIND_TO_CLASS
+    _KIND_TO_CLASS = None
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_load(path: str, mtime_ns: int) -> Tuple[object, ...]:
+    """Load and cache the Kubernetes API objects for an unrendered manifest file.
+
+    The file modification time is not used directly, but is part of the cache
+    key so that a modified file does not return stale objects.
+
+    Args:
+        path: The fully qualified path to the file.
+        mtime_ns: The modification time of the file, in nanoseconds.
+
+    Returns:
+        The Kubernetes API objects for the manifest file.
+    """
+    return tuple(load_file(path, renderer=render))
+
+
+def _load_file(path: str, renderer: Renderer, context: Dict[str, Any]) -> List[object]:
+    """Load a Kubernetes manifest file, reusing previously loaded results.
+
+    The render context includes values which are unique to each test case, such
+    as its namespace, so only manifests which are not rendered are cached. These
+    are the manifests loaded with the default `render` while no module renderer
+    is set, and are only parsed once per file modification.
+
+    Args:
+        path: The fully qualified path to the file.
+        renderer: The callable responsible for rendering the manifest file.
+        context: The template rendering context.
+
+    Returns:
+        A list of the Kubernetes API objects for the manifest file. These are
+        copies, so they are safe for the caller to modify.
+    """
+    if renderer is not render or manifest.__render__ is not None:
+        return load_file(path, renderer=ContextRenderer(renderer, context))
+    return copy.deepcopy(list(_cached_load(path, os.stat(path).st_mtime_ns)))
+
+
+def _wrap_objects(objs: Iterable[object]) -> List[ApiObject]:
+    """Wrap loaded Kubernetes resources in their equivalent kubetest wrapper.
+
+    If a resource does not have an equivalent kubetest wrapper, error out. We
+    cannot reliably create the resource without our ApiObject wrapper semantics.
+
+    Args:
+        objs: The Kubernetes API objects to wrap.
+
+    Returns:
+        The wrapped API objects.
+
+    Raises:
+        ValueError: A resource does not have a kubetest wrapper.
+    """
+    get_class = _get_kind_to_class().__getitem__
+    wrapped = []
+    for obj in objs:
+        try:
+            klass = get_class(obj.kind)
+        except KeyError:
+            raise ValueError(
+                f"Unable to match loaded object to an internal wrapper class: {obj}",
+            ) from None
+        wrapped.append(klass(obj))
+    return wrapped
+
+
 def get_manifest_renderer_for_item(item: pytest.Item) -> Renderer:
     """Return the callable for rendering a manifest template.
 
@@ -144,27 +298,9 @@ def apply_manifest_from_marker(item: pytest.Item, meta: manager.TestMeta) -> Non
         context = dict(
             namespace=meta.ns, test_node_id=meta.node_id, test_name=meta.name
         )
-        context_renderer = ContextRenderer(renderer, context)
-        objs = load_file(path, renderer=context_renderer)
-
-        # For each of the loaded Kubernetes resources, wrap it in the
-        # equivalent kubetest wrapper. If the object does not yet have a
-        # wrapper, error out. We cannot reliably create the resource
-        # without our ApiObject wrapper semantics.
-        wrapped = []
-        found = False
-        for obj in objs:
-            for klass in ApiObject.__subclasses__():
-                if obj.kind == klass.__name__:
-                    wrapped.append(klass(obj))
-                    found = True
-                    break
-            if not found:
-                raise ValueError(
-                    f"Unable to match loaded object to an internal wrapper class: {obj}",
-                )
+        objs = _load_file(path, renderer, context)
 
-        meta.register_objects(wrapped)
+        meta.register_objects(_wrap_objects(objs))
 
 
 def apply_manifests_from_marker(item: pytest.Item, meta: manager.TestMeta) -> None:
@@ -181,10 +317,12 @@ def apply_manifests_from_marker(item: pytest.Item, meta: manager.TestMeta) -> No
         meta: The metainfo object for the marked test case.
     """
     item_renderer = get_manifest_renderer_for_item(item)
+    test_dir = None
     for mark in item.iter_markers(name="applymanifests"):
         dir_path = mark.args[0]
         files = mark.kwargs.get("files")
         renderer = mark.kwargs.get("renderer", item_renderer)
+        expose_objs = mark.kwargs.get("expose_objs", False)
 
         if not callable(renderer):
             raise TypeError("renderer given is not callable")
@@ -193,9 +331,9 @@ def apply_manifests_from_marker(item: pytest.Item, meta: manager.TestMeta) -> No
         # from the test file. If the path is relative, add the directory
         # that the test file resides in as a prefix to the dir_path.
         if not os.path.isabs(dir_path):
-            dir_path = os.path.abspath(
-                os.path.join(os.path.dirname(item.fspath), dir_path)
-            )
+            if test_dir is None:
+                test_dir = os.path.dirname(str(item.fspath))
+            dir_path = os.path.abspath(os.path.join(test_dir, dir_path))
 
         # Setup template rendering context
         context = dict(
@@ -204,38 +342,28 @@ def apply_manifests_from_marker(item: pytest.Item, meta: manager.TestMeta) -> No
             test_node_id=meta.node_id,
             test_name=meta.name,
         )
-        context_renderer = ContextRenderer(renderer, context)
 
         # If there are any files specified, we will only load those files.
         # Otherwise, we'll load everything in the directory.
         if files is None:
-            objs = load_path(dir_path, renderer=context_renderer)
+            paths = find_manifest_files(dir_path)
         else:
-            objs = []
-            context_renderer.context["objs"] = objs
-            for f in files:
-                objs.extend(
-                    load_file(os.path.join(dir_path, f), renderer=context_renderer)
-                )
+            paths = [os.path.join(dir_path, f) for f in files]
 
-        # For each of the loaded Kubernetes resources, we'll want to wrap it
-        # in the equivalent kubetest wrapper. If the resource does not have
-        # an equivalent kubetest wrapper, error out. We cannot reliably create
-        # the resource without our ApiObject wrapper semantics.
-        wrapped = []
-        for obj in objs:
-            found = False
-            for klass in ApiObject.__subclasses__():
-                if obj.kind == klass.__name__:
-                    wrapped.append(klass(obj))
-                    found = True
-                    break
-            if not found:
-                raise ValueError(
-                    f"Unable to match loaded object to an internal wrapper class: {obj}",
-                )
+        # If enabled, objects which have already been loaded are made available
+        # to the templates of subsequent files via the "objs" context variable.
+        # Otherwise, the objects are wrapped as each file is loaded.
+        if expose_objs:
+            objs = []
+            context["objs"] = objs
+            for path in paths:
+                objs.extend(_load_file(path, renderer, context))
+        else:
+            objs = itertools.chain.from_iterable(
+                _load_file(path, renderer, context) for path in paths
+            )
 
-        meta.register_objects(wrapped)
+        meta.register_objects(_wrap_objects(objs))
 
 
 def rolebindings_from_marker(item: pytest.Item, namespace: str) -> List[RoleBinding]:
@@ -266,13 +394,16 @@ def rolebindings_from_marker(item: pytest.Item, namespace: str) -> List[RoleBind
                     metadata=client.V1ObjectMeta(
                         name=f"kubetest:{item.name}",
                         namespace=namespace,
+                        local_vars_configuration=_MODEL_CONFIGURATION,
                     ),
                     role_ref=client.V1RoleRef(
-                        api_group="rbac.authorization.k8s.io",
+                        api_group=_RBAC_API_GROUP,
                         kind=kind,
                         name=name,
+                        local_vars_configuration=_MODEL_CONFIGURATION,
                     ),
                     subjects=subj,
+                    local_vars_configuration=_MODEL_CONFIGURATION,
                 )
             )
         )
@@ -301,20 +432,23 @@ def clusterrolebindings_from_marker(
 
         subj = get_custom_rbac_subject(namespace, subj_kind, subj_name)
         if not subj:
-            subj = get_default_rbac_subjects(namespace)
+            subj = get_default_rbac_subjects(None)
 
         clusterrolebindings.append(
             ClusterRoleBinding(
                 client.V1ClusterRoleBinding(
                     metadata=client.V1ObjectMeta(
                         name=f"kubetest:{item.name}",
+                        local_vars_configuration=_MODEL_CONFIGURATION,
                     ),
                     role_ref=client.V1RoleRef(
-                        api_group="rbac.authorization.k8s.io",
+                        api_group=_RBAC_API_GROUP,
                         kind="ClusterRole",
                         name=name,
+                        local_vars_configuration=_MODEL_CONFIGURATION,
                     ),
                     subjects=subj,
+                    local_vars_configuration=_MODEL_CONFIGURATION,
                 )
             )
         )
@@ -353,10 +487,11 @@ def get_custom_rbac_subject(
     if name is not None and kind is not None:
         return [
             client.RbacV1Subject(
-                api_group="rbac.authorization.k8s.io",
+                api_group=_RBAC_API_GROUP,
                 namespace=namespace,
                 kind=kind,
                 name=name,
+                local_vars_configuration=_MODEL_CONFIGURATION,
             )
         ]
     else:
@@ -378,25 +513,12 @@ def get_default_rbac_subjects(namespace: str) -> List[client.RbacV1Subject]:
         The default RBAC subjects.
     """
     return [
-        # all authenticated users
-        client.RbacV1Subject(
-            api_group="rbac.authorization.k8s.io",
-            namespace=namespace,
-            name="system:authenticated",
-            kind="Group",
-        ),
-        # all unauthenticated users
         client.RbacV1Subject(
-            api_group="rbac.authorization.k8s.io",
+            api_group=_RBAC_API_GROUP,
             namespace=namespace,
-            name="system:unauthenticated",
-            kind="Group",
-        ),
-        # all service accounts
-        client.RbacV1Subject(
-            api_group="rbac.authorization.k8s.io",
-            namespace=namespace,
-            name="system:serviceaccounts",
-            kind="Group",
-        ),
+            name=name,
+            kind=kind,
+            local_vars_configuration=_MODEL_CONFIGURATION,
+        )
+        for name, kind in _DEFAULT_SUBJECTS
     ]
@@ -1,31 +1,88 @@
-"""Kubetest wrappers around Kubernetes API Objects."""
+"""Kubetest wrappers around Kubernetes API Objects.
+
+The wrappers are imported lazily, when they are first accessed from this
+package, so that only the wrappers which are used need to be loaded.
+"""
 
 # flake8: noqa
 
-from .api_object import ApiObject
-from .clusterrole import ClusterRole
-from .clusterrolebinding import ClusterRoleBinding
-from .configmap import ConfigMap
-from .container import Container
-from .csidriver import CSIDriver
-from .custom_objects import CustomObject
-from .customresourcedefinition import CustomResourceDefinition
-from .daemonset import DaemonSet
-from .deployment import Deployment
-from .endpoints import Endpoints
-from .event import Event
-from .ingress import Ingress
-from .job import Job
-from .namespace import Namespace
-from .node import Node
-from .persistentvolume import PersistentVolume
-from .persistentvolumeclaim import PersistentVolumeClaim
-from .pod import Pod
-from .replicaset import ReplicaSet
-from .rolebinding import RoleBinding
-from .secret import Secret
-from .service import Service
-from .serviceaccount import ServiceAccount
-from .statefulset import StatefulSet
-from .storageclass import StorageClass
-from .version import Version
+import importlib
+from typing import TYPE_CHECKING
+
+# A mapping of the wrapper classes exported by this package to the name of
+# the module which defines them.
+_WRAPPER_MODULES = {
+    "ApiObject": "api_object",
+    "ClusterRole": "clusterrole",
+    "ClusterRoleBinding": "clusterrolebinding",
+    "ConfigMap": "configmap",
+    "Container": "container",
+    "CSIDriver": "csidriver",
+    "CustomObject": "custom_objects",
+    "CustomResourceDefinition": "customresourcedefinition",
+    "DaemonSet": "daemonset",
+    "Deployment": "deployment",
+    "Endpoints": "endpoints",
+    "Event": "event",
+    "Ingress": "ingress",
+    "Job": "job",
+    "Namespace": "namespace",
+    "Node": "node",
+    "PersistentVolume": "persistentvolume",
+    "PersistentVolumeClaim": "persistentvolumeclaim",
+    "Pod": "pod",
+    "ReplicaSet": "replicaset",
+    "RoleBinding": "rolebinding",
+    "Secret": "secret",
+    "Service": "service",
+    "ServiceAccount": "serviceaccount",
+    "StatefulSet": "statefulset",
+    "StorageClass": "storageclass",
+    "Version": "version",
+}
+
+__all__ = list(_WRAPPER_MODULES)
+
+
+def __getattr__(name):
+    module = _WRAPPER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .api_object import ApiObject
+    from .clusterrole import ClusterRole
+    from .clusterrolebinding import ClusterRoleBinding
+    from .configmap import ConfigMap
+    from .container import Container
+    from .csidriver import CSIDriver
+    from .custom_objects import CustomObject
+    from .customresourcedefinition import CustomResourceDefinition
+    from .daemonset import DaemonSet
+    from .deployment import Deployment
+    from .endpoints import Endpoints
+    from .event import Event
+    from .ingress import Ingress
+    from .job import Job
+    from .namespace import Namespace
+    from .node import Node
+    from .persistentvolume import PersistentVolume
+    from .persistentvolumeclaim import PersistentVolumeClaim
+    from .pod import Pod
+    from .replicaset import ReplicaSet
+    from .rolebinding import RoleBinding
+    from .secret import Secret
+    from .service import Service
+    from .serviceaccount import ServiceAccount
+    from .statefulset import StatefulSet
+    from .storageclass import StorageClass
+    from .version import Version
@@ -12,6 +12,36 @@ from kubetest.manifest import load_file
 
 log = logging.getLogger("kubetest")
 
+# The delete options used when a wrapper is deleted without explicit options.
+# These are only serialized into the delete request body and are never modified,
+# so a single instance is shared rather than created for each delete.
+_DEFAULT_DELETE_OPTIONS = client.V1DeleteOptions()
+
+# The ApiClient shared by all wrappers which are not given an explicit api client,
+# and the default kubernetes Configuration it was created from.
+_shared_api_client: Optional[kubernetes.client.ApiClient] = None
+_shared_api_client_config: Optional[kubernetes.client.Configuration] = None
+
+
+def _get_shared_api_client() -> kubernetes.client.ApiClient:
+    """Get the ApiClient shared by wrappers which are not given an api client.
+
+    Sharing a single client lets wrappers reuse its connection pool instead of
+    each creating their own. A new client is created whenever the default
+    kubernetes Configuration changes (e.g. when a kube config is (re)loaded),
+    so the shared client always targets the active cluster.
+
+    Returns:
+        The shared kubernetes ApiClient.
+    """
+    global _shared_api_client, _shared_api_client_config
+
+    config = kubernetes.client.Configuration._default
+    if _shared_api_client is None or _shared_api_client_config is not config:
+        _shared_api_client = kubernetes.client.ApiClient()
+        _shared_api_client_config = config
+    return _shared_api_client
+
 
 class ApiObject(abc.ABC):
     """ApiObject is the base class for many of the kubetest objects
@@ -59,7 +89,7 @@ class ApiObject(abc.ABC):
         # by the apiVersion of the object's manifest.
         self._api_client = None
 
-        self.raw_api_client = api_client or kubernetes.client.ApiClient()
+        self.raw_api_client = api_client or _get_shared_api_client()
 
     def __str__(self) -> str:
         return str(self.obj)
@@ -106,30 +136,28 @@ class ApiObject(abc.ABC):
         """The API client for the Kubernetes object. This is determined
         by the ``apiVersion`` of the object configuration.
 
+        The client is resolved the first time it is accessed and the same
+        client is returned on subsequent accesses.
+
         Raises:
             ValueError: The API version is not supported.
         """
-        if self._api_client is None:
-            c = self.api_clients.get(self.version)
-            # If we didn't find the client in the api_clients dict, use the
-            # preferred version.
+        api_client = self._api_client
+        if api_client is not None:
+            return api_client
+
+        c = self.api_clients.get(self.version)
+        # If we didn't find the client in the api_clients dict, use the
+        # preferred version.
+        if c is None:
+            c = self.api_clients.get("preferred")
             if c is None:
-                # log.debug(f"unknown version ({self.version}), falling back to preferred version")
-                c = self.api_clients.get("preferred")
-                if c is None:
-                    raise ValueError(
-                        "unknown version specified and no preferred version "
-                        f"defined for resource ({self.version})"
-                    )
-            # If we did find it, initialize that client version.
-            # log.debug(
-            #    f"Initialize _api_client for {inspect.getmro(self.__class__)[0].__name__} "
-            #    f"for {self.raw_api_client.configuration.host}")
-            self._api_client = c(api_client=self.raw_api_client)
-
-        # log.debug(
-        #    f"Using _api_client for {inspect.getmro(self.__class__)[0].__name__} "
-        #    f"for {self.raw_api_client.configuration.host}")
+                raise ValueError(
+                    "unknown version specified and no preferred version "
+                    f"defined for resource ({self.version})"
+                )
+        # If we did find it, initialize that client version.
+        self._api_client = c(api_client=self.raw_api_client)
         return self._api_client
 
     @classmethod
@@ -145,7 +173,7 @@ class ApiObject(abc.ABC):
             raise ValueError(
                 f"no preferred api client defined for object {cls.__name__}",
             )
-        raw_api_client = api_client or kubernetes.client.ApiClient()
+        raw_api_client = api_client or _get_shared_api_client()
         return c(api_client=raw_api_client)
 
     def wait_until_ready(
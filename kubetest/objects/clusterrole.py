@@ -5,6 +5,7 @@ import logging
 from kubernetes import client
 
 from kubetest.objects import ApiObject
+from kubetest.objects.api_object import _DEFAULT_DELETE_OPTIONS
 
 log = logging.getLogger("kubetest")
 
@@ -36,7 +37,7 @@ class ClusterRole(ApiObject):
             namespace: This argument is ignored for ClusterRole.
         """
         log.info(f'creating clusterrole "{self.name}" in namespace "{self.namespace}"')
-        log.debug(f"clusterrole: {self.obj}")
+        log.debug("clusterrole: %s", self.obj)
 
         self.obj = self.api_client.create_cluster_role(
             body=self.obj,
@@ -56,11 +57,11 @@ class ClusterRole(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting clusterrole "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"clusterrole: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("clusterrole: %s", self.obj)
 
         return self.api_client.delete_cluster_role(
             name=self.name,
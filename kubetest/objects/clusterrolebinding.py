@@ -4,7 +4,7 @@ import logging
 
 from kubernetes import client
 
-from .api_object import ApiObject
+from .api_object import _DEFAULT_DELETE_OPTIONS, ApiObject
 
 log = logging.getLogger("kubetest")
 
@@ -38,7 +38,7 @@ class ClusterRoleBinding(ApiObject):
         log.info(
             f'creating clusterrolebinding "{self.name}" in namespace "{self.namespace}"'
         )
-        log.debug(f"clusterrolebinding: {self.obj}")
+        log.debug("clusterrolebinding: %s", self.obj)
 
         self.obj = self.api_client.create_cluster_role_binding(
             body=self.obj,
@@ -58,11 +58,11 @@ class ClusterRoleBinding(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting clusterrolebinding "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"clusterrolebinding: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("clusterrolebinding: %s", self.obj)
 
         return self.api_client.delete_cluster_role_binding(
             name=self.name,
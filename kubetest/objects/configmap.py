@@ -4,7 +4,7 @@ import logging
 
 from kubernetes import client
 
-from .api_object import ApiObject
+from .api_object import _DEFAULT_DELETE_OPTIONS, ApiObject
 
 log = logging.getLogger("kubetest")
 
@@ -42,7 +42,7 @@ class ConfigMap(ApiObject):
             namespace = self.namespace
 
         log.info(f'creating configmap "{self.name}" in namespace "{self.namespace}"')
-        log.debug(f"configmap: {self.obj}")
+        log.debug("configmap: %s", self.obj)
 
         self.obj = self.api_client.create_namespaced_config_map(
             namespace=namespace,
@@ -63,11 +63,11 @@ class ConfigMap(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting configmap "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"configmap: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("configmap: %s", self.obj)
 
         return self.api_client.delete_namespaced_config_map(
             name=self.name,
@@ -7,6 +7,7 @@ from kubernetes import client
 from kubernetes.client import ApiException
 
 from kubetest.objects import ApiObject
+from kubetest.objects.api_object import _DEFAULT_DELETE_OPTIONS
 
 LOG = logging.getLogger("kubetest")
 
@@ -37,26 +38,23 @@ class CSIDriver(ApiObject):
 
     def delete(self, options: client.V1DeleteOptions = None) -> Optional[Any]:
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
-        LOG.info(f'deleting csi "{self.name}"')
-        LOG.debug(f"delete options: {options}")
-        LOG.debug(f"csi: {self.obj}")
+        LOG.info('deleting csi "%s"', self.name)
+        LOG.debug("delete options: %s", options)
+        LOG.debug("csi: %s", self.obj)
         try:
-            self.refresh()
-
             return self.api_client.delete_csi_driver(
                 name=self.name,
                 body=options,
             )
         except ApiException as e:
             # If we can no longer find the csi, it is already deleted.
-            if e.status == 404 and e.reason == "Not Found":
+            if e.status == 404:
                 return None
-            else:
-                # If we get any other exception, raise it.
-                LOG.error("error deleting persistent volume")
-                raise e
+            # If we get any other exception, raise it.
+            LOG.error("error deleting csi driver")
+            raise e
 
     def refresh(self) -> None:
         """Refresh the underlying Kubernetes CSI resource."""
@@ -3,7 +3,7 @@ import logging
 
 from kubernetes import client
 
-from .api_object import ApiObject
+from .api_object import _DEFAULT_DELETE_OPTIONS, ApiObject
 
 log = logging.getLogger("kubetest")
 
@@ -37,7 +37,7 @@ class CustomResourceDefinition(ApiObject):
         log.info(
             f'creating customresourcedefinition "{self.name}" in namespace "{self.namespace}"'
         )
-        log.debug(f"customresourcedefinition: {self.obj}")
+        log.debug("customresourcedefinition: %s", self.obj)
 
         self.obj = self.api_client.create_custom_resource_definition(
             body=self.obj,
@@ -54,11 +54,11 @@ class CustomResourceDefinition(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting customresourcedefinition "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"customresourcedefinition: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("customresourcedefinition: %s", self.obj)
 
         return self.api_client.delete_custom_resource_definition(
             name=self.name,
@@ -5,6 +5,7 @@ import uuid
 
 from kubernetes import client
 
+from .api_object import _DEFAULT_DELETE_OPTIONS
 from .workload import Workload
 
 log = logging.getLogger("kubetest")
@@ -110,7 +111,7 @@ class Deployment(Workload):
             namespace = self.namespace
 
         log.info(f'creating deployment "{self.name}" in namespace "{self.namespace}"')
-        log.debug(f"deployment: {self.obj}")
+        log.debug("deployment: %s", self.obj)
 
         self.obj = self.api_client.create_namespaced_deployment(
             namespace=namespace,
@@ -131,11 +132,11 @@ class Deployment(Workload):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting deployment "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"deployment: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("deployment: %s", self.obj)
 
         return self.api_client.delete_namespaced_deployment(
             name=self.name,
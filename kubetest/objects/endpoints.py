@@ -4,7 +4,7 @@ import logging
 
 from kubernetes import client
 
-from .api_object import ApiObject
+from .api_object import _DEFAULT_DELETE_OPTIONS, ApiObject
 
 log = logging.getLogger("kubetest")
 
@@ -39,7 +39,7 @@ class Endpoints(ApiObject):
             namespace = self.namespace
 
         log.info(f'creating endpoints "{self.name}" in namespace "{self.namespace}"')
-        log.debug(f"endpoints: {self.obj}")
+        log.debug("endpoints: %s", self.obj)
 
         self.obj = self.api_client.create_namespaced_endpoints(
             namespace=namespace,
@@ -60,11 +60,11 @@ class Endpoints(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting endpoints "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"endpoints: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("endpoints: %s", self.obj)
 
         return self.api_client.delete_namespaced_endpoints(
             name=self.name,
@@ -30,8 +30,11 @@ class Event:
         "events.k8s.io": client.CoreV1Event,
     }
 
+    __slots__ = ("obj", "name", "namespace", "api_client")
+
     def __init__(self, api_object, api_client=None) -> None:
+        metadata = api_object.metadata
         self.obj = api_object
-        self.name = api_object.metadata.name
-        self.namespace = api_object.metadata.namespace
+        self.name = metadata.name
+        self.namespace = metadata.namespace
         self.api_client = api_client
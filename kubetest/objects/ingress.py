@@ -1,16 +1,35 @@
 """Kubetest wrapper for the Kubernetes ``Ingress`` API Object."""
 
 import logging
+import operator
 from typing import Union
 
 from kubernetes import client
 
 from kubetest import condition, utils
 
-from .api_object import ApiObject
+from .api_object import _DEFAULT_DELETE_OPTIONS, ApiObject
 
 log = logging.getLogger("kubetest")
 
+_get_load_balancer_ingress = operator.attrgetter("status.load_balancer.ingress")
+
+
+def _has_load_balancer_ingress(obj: client.V1Ingress) -> bool:
+    """Check if the Ingress model has been assigned a load balancer ingress.
+
+    Args:
+        obj: The Ingress model to check. This is not refreshed.
+
+    Returns:
+        True if an ingress has been assigned; False otherwise.
+    """
+    try:
+        return _get_load_balancer_ingress(obj) is not None
+    except AttributeError:
+        # The status or load balancer status is not yet set.
+        return False
+
 
 class Ingress(ApiObject):
     """Kubetest wrapper around a Kubernetes `Ingress`_ API Object.
@@ -72,7 +91,7 @@ class Ingress(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info('deleting ingress "%s"', self.name)
         log.debug("delete options: %s", options)
@@ -111,7 +130,7 @@ class Ingress(ApiObject):
             True if an ingress has been assigned; False otherwise.
         """
         self.refresh()
-        return self.obj.status.load_balancer.ingress is not None
+        return _has_load_balancer_ingress(self.obj)
 
     def wait_for_load_balancer_ingress(
         self, timeout: int = None, interval: Union[float, int] = 1
@@ -129,8 +148,16 @@ class Ingress(ApiObject):
         Raises:
             TimeoutError: The specified timeout was exceeded.
         """
+
+        def has_ingress() -> bool:
+            # Only read the Ingress from the cluster if the current state does
+            # not already have an ingress assigned.
+            return (
+                _has_load_balancer_ingress(self.obj) or self.has_load_balancer_ingress()
+            )
+
         wait_condition = condition.Condition(
-            "Ingress has been assigned an ingress", self.has_load_balancer_ingress
+            "Ingress has been assigned an ingress", has_ingress
         )
 
         utils.wait_for_condition(
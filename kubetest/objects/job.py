@@ -5,6 +5,7 @@ import uuid
 
 from kubernetes import client
 
+from .api_object import _DEFAULT_DELETE_OPTIONS
 from .workload import Workload
 
 log = logging.getLogger("kubetest")
@@ -112,7 +113,7 @@ class Job(Workload):
             namespace = self.namespace
 
         log.info(f'creating job "{self.name}" in namespace "{self.namespace}"')
-        log.debug(f"job: {self.obj}")
+        log.debug("job: %s", self.obj)
 
         self.obj = self.api_client.create_namespaced_job(
             namespace=namespace,
@@ -133,11 +134,11 @@ class Job(Workload):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting job "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"job: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("job: %s", self.obj)
 
         return self.api_client.delete_namespaced_job(
             name=self.name,
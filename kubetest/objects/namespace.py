@@ -6,6 +6,7 @@ import kubernetes.client
 from kubernetes import client
 
 from kubetest.objects import ApiObject
+from kubetest.objects.api_object import _DEFAULT_DELETE_OPTIONS
 
 log = logging.getLogger("kubetest")
 
@@ -61,7 +62,7 @@ class Namespace(ApiObject):
             self.name = name
 
         log.info(f'creating namespace "{self.name}"')
-        log.debug(f"namespace: {self.obj}")
+        log.debug("namespace: %s", self.obj)
 
         self.obj = self.api_client.create_namespace(
             body=self.obj,
@@ -77,11 +78,11 @@ class Namespace(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting namespace "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"namespace: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("namespace: %s", self.obj)
 
         return self.api_client.delete_namespace(
             name=self.name,
@@ -7,6 +7,7 @@ from kubernetes import client
 from kubernetes.client import ApiException
 
 from kubetest.objects import ApiObject
+from kubetest.objects.api_object import _DEFAULT_DELETE_OPTIONS
 
 LOG = logging.getLogger("kubetest")
 
@@ -36,11 +37,11 @@ class PersistentVolume(ApiObject):
 
     def delete(self, options: client.V1DeleteOptions = None) -> Optional[Any]:
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         LOG.info(f'deleting pv "{self.name}"')
-        LOG.debug(f"delete options: {options}")
-        LOG.debug(f"pv: {self.obj}")
+        LOG.debug("delete options: %s", options)
+        LOG.debug("pv: %s", self.obj)
         try:
             self.refresh()
 
@@ -4,7 +4,7 @@ import logging
 
 from kubernetes import client
 
-from .api_object import ApiObject
+from .api_object import _DEFAULT_DELETE_OPTIONS, ApiObject
 
 log = logging.getLogger("kubetest")
 
@@ -73,7 +73,7 @@ class PersistentVolumeClaim(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info('deleting persistentvolumeclaim "%s"', self.name)
         log.debug("delete options: %s", options)
@@ -8,7 +8,7 @@ from kubernetes.client.rest import ApiException
 
 from kubetest import condition, response, utils
 
-from .api_object import ApiObject
+from .api_object import _DEFAULT_DELETE_OPTIONS, ApiObject
 from .container import Container
 
 log = logging.getLogger("kubetest")
@@ -47,7 +47,7 @@ class Pod(ApiObject):
             namespace = self.namespace
 
         log.info(f'creating pod "{self.name}" in namespace "{self.namespace}"')
-        log.debug(f"pod: {self.obj}")
+        log.debug("pod: %s", self.obj)
 
         self.obj = self.api_client.create_namespaced_pod(
             namespace=namespace,
@@ -68,11 +68,11 @@ class Pod(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting pod "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"pod: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("pod: %s", self.obj)
 
         return self.api_client.delete_namespaced_pod(
             name=self.name,
@@ -5,6 +5,7 @@ import uuid
 
 from kubernetes import client
 
+from .api_object import _DEFAULT_DELETE_OPTIONS
 from .workload import Workload
 
 log = logging.getLogger("kubetest")
@@ -114,7 +115,7 @@ class ReplicaSet(Workload):
             namespace = self.namespace
 
         log.info(f'creating replicaset "{self.name}" in namespace "{self.namespace}"')
-        log.debug(f"replicaset: {self.obj}")
+        log.debug("replicaset: %s", self.obj)
 
         self.obj = self.api_client.create_namespaced_replica_set(
             namespace=namespace,
@@ -135,11 +136,11 @@ class ReplicaSet(Workload):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting replicaset "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"replicaset: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("replicaset: %s", self.obj)
 
         return self.api_client.delete_namespaced_replica_set(
             name=self.name,
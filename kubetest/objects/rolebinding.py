@@ -4,7 +4,7 @@ import logging
 
 from kubernetes import client
 
-from .api_object import ApiObject
+from .api_object import _DEFAULT_DELETE_OPTIONS, ApiObject
 
 log = logging.getLogger("kubetest")
 
@@ -44,7 +44,7 @@ class RoleBinding(ApiObject):
         log.info(
             f'creating rolebinding "{self.name}" in namespace "{self.namespace}"'
         )  # noqa
-        log.debug(f"rolebinding: {self.obj}")
+        log.debug("rolebinding: %s", self.obj)
 
         self.obj = self.api_client.create_namespaced_role_binding(
             namespace=namespace,
@@ -65,11 +65,11 @@ class RoleBinding(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting rolebinding "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"rolebinding: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("rolebinding: %s", self.obj)
 
         return self.api_client.delete_namespaced_role_binding(
             namespace=self.namespace,
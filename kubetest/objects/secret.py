@@ -4,7 +4,7 @@ import logging
 
 from kubernetes import client
 
-from .api_object import ApiObject
+from .api_object import _DEFAULT_DELETE_OPTIONS, ApiObject
 
 log = logging.getLogger("kubetest")
 
@@ -42,7 +42,7 @@ class Secret(ApiObject):
             namespace = self.namespace
 
         log.info(f'creating secret "{self.name}" in namespace "{self.namespace}"')
-        log.debug(f"secret: {self.obj}")
+        log.debug("secret: %s", self.obj)
 
         self.obj = self.api_client.create_namespaced_secret(
             namespace=namespace,
@@ -63,11 +63,11 @@ class Secret(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting secret "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"secret: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("secret: %s", self.obj)
 
         return self.api_client.delete_namespaced_secret(
             name=self.name,
@@ -5,7 +5,7 @@ from typing import List
 
 from kubernetes import client
 
-from .api_object import ApiObject
+from .api_object import _DEFAULT_DELETE_OPTIONS, ApiObject
 
 log = logging.getLogger("kubetest")
 
@@ -43,7 +43,7 @@ class Service(ApiObject):
             namespace = self.namespace
 
         log.info(f'creating service "{self.name}" in namespace "{self.namespace}"')
-        log.debug(f"service: {self.obj}")
+        log.debug("service: %s", self.obj)
 
         self.obj = self.api_client.create_namespaced_service(
             namespace=namespace,
@@ -64,11 +64,11 @@ class Service(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting service "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"service: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("service: %s", self.obj)
 
         return self.api_client.delete_namespaced_service(
             name=self.name,
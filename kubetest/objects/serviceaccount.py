@@ -5,6 +5,7 @@ import logging
 from kubernetes import client
 
 from kubetest.objects import ApiObject
+from kubetest.objects.api_object import _DEFAULT_DELETE_OPTIONS
 
 log = logging.getLogger("kubetest")
 
@@ -38,7 +39,7 @@ class ServiceAccount(ApiObject):
             self.name = name
 
         log.info(f'creating serviceaccount "{self.name}"')
-        log.debug(f"serviceaccount: {self.obj}")
+        log.debug("serviceaccount: %s", self.obj)
 
         self.obj = self.api_client.create_namespaced_service_account(
             body=self.obj,
@@ -53,11 +54,11 @@ class ServiceAccount(ApiObject):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting ServiceAccount "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"service account: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("service account: %s", self.obj)
 
         return self.api_client.delete_namespaced_service_account(
             name=self.name, namespace=self.namespace, body=options
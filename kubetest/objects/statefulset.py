@@ -5,6 +5,7 @@ import uuid
 
 from kubernetes import client
 
+from .api_object import _DEFAULT_DELETE_OPTIONS
 from .workload import Workload
 
 log = logging.getLogger("kubetest")
@@ -110,7 +111,7 @@ class StatefulSet(Workload):
             namespace = self.namespace
 
         log.info(f'creating statefulset "{self.name}" in namespace "{self.namespace}"')
-        log.debug(f"statefulset: {self.obj}")
+        log.debug("statefulset: %s", self.obj)
 
         self.obj = self.api_client.create_namespaced_stateful_set(
             namespace=namespace,
@@ -131,11 +132,11 @@ class StatefulSet(Workload):
             The status of the delete operation.
         """
         if options is None:
-            options = client.V1DeleteOptions()
+            options = _DEFAULT_DELETE_OPTIONS
 
         log.info(f'deleting statefulset "{self.name}"')
-        log.debug(f"delete options: {options}")
-        log.debug(f"statefulset: {self.obj}")
+        log.debug("delete options: %s", options)
+        log.debug("statefulset: %s", self.obj)
 
         return self.api_client.delete_namespaced_stateful_set(
             name=self.name,
@@ -1,9 +1,14 @@
 """Kubetest wrapper for the Kubernetes ``version`` API Object."""
 
+import re
+
 from kubernetes import client
 
 from kubetest.objects import ApiObject
 
+# Matches the leading digits of a version component, e.g. "28" in "28+".
+_LEADING_DIGITS = re.compile(r"\d*")
+
 
 class Version(ApiObject):
     """Kubetest wrapper around a Kubernetes `VersionInfo`_ API Object.
@@ -48,15 +53,9 @@ class Version(ApiObject):
         :param digit_only:  To parse minor version such as 28+, we keep only the leading part
         :return: major, minor tuple
         """
-        minor = ""
+        minor = self.obj.minor
         if digit_only:
-            for char in self.obj.minor:
-                if char.isdigit():
-                    minor += char
-                else:
-                    break  # Stop when a non-digit character is encountered
-        else:
-            minor = self.obj.minor
+            minor = _LEADING_DIGITS.match(minor).group(0)
         return self.obj.major, minor
 
     def get_version_code(self):
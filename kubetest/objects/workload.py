@@ -2,8 +2,9 @@
 daemonset, deployment, job, replicaset, statefulset
 """
 import abc
+import functools
 import logging
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 
 from kubernetes import client
 
@@ -14,6 +15,56 @@ from .pod import Pod
 
 log = logging.getLogger("kubetest")
 
+# Formatters for the requirements in a label selector's match_expressions, keyed
+# by the requirement operator. Each takes the requirement key and values.
+_EXPR_FMT = {
+    "In": lambda key, values: f"{key} in ({','.join(values)})",
+    "NotIn": lambda key, values: f"{key} notin ({','.join(values)})",
+    "Exists": lambda key, values: key,
+    "DoesNotExist": lambda key, values: f"!{key}",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _selector_cached(items: Tuple[Tuple[str, Optional[str]], ...]) -> str:
+    """Create a selector string from the given label items.
+
+    Workloads which are polled for their pods select them by the same kubetest
+    label on each call, so the selector strings are cached.
+
+    Args:
+        items: The (key, value) pairs of the labels to select.
+
+    Returns:
+        The selector string for the given labels.
+    """
+    return selector_string(dict(items))
+
+
+def _label_selector_parts(label_selector: client.V1LabelSelector) -> Iterator[str]:
+    """Generate the selector string parts for a label selector.
+
+    Args:
+        label_selector: The label selector of a workload spec.
+
+    Yields:
+        The selector string for the match_labels of the label selector, if any,
+        followed by the selector string of each of its match_expressions.
+    """
+    if label_selector.match_labels:
+        yield selector_string(label_selector.match_labels)
+
+    for expr in label_selector.match_expressions or ():
+        fmt = _EXPR_FMT.get(expr.operator)
+        if fmt is None:
+            log.warning(
+                "unknown label selector operator %s for key %s - skipping",
+                expr.operator,
+                expr.key,
+            )
+            continue
+        yield fmt(expr.key, expr.values or [])
+
 
 class Workload(ApiObject):
     def __init__(self, api_object, *args, **kwargs):
@@ -21,6 +72,15 @@ class Workload(ApiObject):
         self.klabel_key = None
         self.klabel_uid = None
 
+        # The CoreV1Api used to list the workload's pods. This is created
+        # the first time it is needed and reused for subsequent lookups.
+        self._core_api = None
+
+        # The spec label selector the pod selector string was last built from,
+        # and that selector string. The string is rebuilt when the spec selector
+        # is replaced, e.g. when the workload is refreshed.
+        self._pod_selector = None
+
     @abc.abstractmethod
     def create(self, namespace: str = None) -> None:
         pass
@@ -45,17 +105,12 @@ class Workload(ApiObject):
         log.info(f'getting pods for {self.__class__.name} "{self.name}"')
         selector = None
         if self.klabel_key and self.klabel_uid:
-            selector = selector_string({self.klabel_key: self.klabel_uid})
+            selector = _selector_cached(((self.klabel_key, self.klabel_uid),))
         elif self.obj.spec.selector:
-            if self.obj.spec.selector.match_labels:
-                selector = selector_string(self.obj.spec.selector.match_labels)
-            elif self.obj.spec.selector.match_expressions:
-                # TODO
-                pass
-            else:
-                # TODO
-                pass
-        pods = client.CoreV1Api(api_client=self.raw_api_client).list_namespaced_pod(
+            selector = self._spec_selector_string(self.obj.spec.selector)
+        if self._core_api is None:
+            self._core_api = client.CoreV1Api(api_client=self.raw_api_client)
+        pods = self._core_api.list_namespaced_pod(
             namespace=self.namespace, label_selector=selector
         )
 
@@ -63,6 +118,25 @@ class Workload(ApiObject):
         log.debug(f"pods: {[p.name for p in pods]}")
         return pods
 
+    def _spec_selector_string(
+        self, label_selector: client.V1LabelSelector
+    ) -> Optional[str]:
+        """Get the pod selector string for the label selector of the workload spec.
+
+        Args:
+            label_selector: The label selector of the workload spec.
+
+        Returns:
+            The selector string, or None if the label selector is empty.
+        """
+        cached = self._pod_selector
+        if cached is not None and cached[0] is label_selector:
+            return cached[1]
+
+        selector = ",".join(_label_selector_parts(label_selector)) or None
+        self._pod_selector = (label_selector, selector)
+        return selector
+
     def num_replicas(self):
         self.refresh()
         return self.obj.spec.replicas
@@ -3,6 +3,7 @@
 import os
 
 import pytest
+from kubernetes import client
 
 from kubetest.objects import ConfigMap, Deployment, Service
 
@@ -89,3 +90,31 @@ class TestApiObject:
             Service.load(
                 os.path.join(manifest_dir, "multi-obj-manifest.yaml"), name="service-c"
             )
+
+    def test_shared_api_client(self, simple_deployment, simple_service):
+        """Wrappers which are not given an api client share the same client."""
+
+        deployment = Deployment(simple_deployment)
+        service = Service(simple_service)
+
+        assert deployment.raw_api_client is service.raw_api_client
+
+    def test_shared_api_client_config_change(
+        self, monkeypatch, simple_deployment, simple_service
+    ):
+        """A new shared api client is used once the default config changes."""
+
+        deployment = Deployment(simple_deployment)
+
+        monkeypatch.setattr(client.Configuration, "_default", client.Configuration())
+        service = Service(simple_service)
+
+        assert deployment.raw_api_client is not service.raw_api_client
+
+    def test_explicit_api_client(self, simple_deployment):
+        """Wrappers use the api client they are given."""
+
+        api_client = client.ApiClient()
+        deployment = Deployment(simple_deployment, api_client=api_client)
+
+        assert deployment.raw_api_client is api_client
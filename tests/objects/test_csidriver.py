@@ -0,0 +1,47 @@
+"""Unit tests for the kubetest.objects.csidriver module."""
+
+from unittest.mock import Mock
+
+import pytest
+from kubernetes import client
+from kubernetes.client import ApiException
+
+from kubetest.objects import CSIDriver
+
+
+@pytest.fixture()
+def csidriver():
+    return CSIDriver(
+        client.V1CSIDriver(
+            metadata=client.V1ObjectMeta(name="test-csi"),
+            spec=client.V1CSIDriverSpec(),
+        )
+    )
+
+
+class TestCSIDriver:
+    def test_delete(self, csidriver):
+        """Deleting the CSIDriver only issues the delete request."""
+
+        csidriver._api_client = Mock()
+        csidriver.delete()
+
+        csidriver._api_client.delete_csi_driver.assert_called_once()
+        csidriver._api_client.read_csi_driver.assert_not_called()
+
+    def test_delete_not_found(self, csidriver):
+        """Deleting a CSIDriver which no longer exists is not an error."""
+
+        csidriver._api_client = Mock()
+        csidriver._api_client.delete_csi_driver.side_effect = ApiException(status=404)
+
+        assert csidriver.delete() is None
+
+    def test_delete_error(self, csidriver):
+        """Other errors deleting the CSIDriver are raised."""
+
+        csidriver._api_client = Mock()
+        csidriver._api_client.delete_csi_driver.side_effect = ApiException(status=500)
+
+        with pytest.raises(ApiException):
+            csidriver.delete()
@@ -0,0 +1,22 @@
+"""Unit tests for the kubetest.objects.event module."""
+
+from kubernetes import client
+
+from kubetest.objects import Event
+
+
+def test_event():
+    """An Event is built from its CoreV1Event and defines no instance dict."""
+
+    obj = client.CoreV1Event(
+        metadata=client.V1ObjectMeta(name="test-event", namespace="test-ns"),
+        involved_object=client.V1ObjectReference(kind="Pod", name="test-pod"),
+    )
+
+    event = Event(obj)
+
+    assert event.obj is obj
+    assert event.name == "test-event"
+    assert event.namespace == "test-ns"
+    assert event.api_client is None
+    assert not hasattr(event, "__dict__")
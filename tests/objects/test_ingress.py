@@ -0,0 +1,44 @@
+"""Unit tests for the kubetest.objects.ingress module."""
+
+from kubernetes import client
+
+from kubetest.objects import Ingress
+
+
+class TestIngress:
+    def test_wait_for_load_balancer_ingress_already_assigned(
+        self, monkeypatch, simple_ingress
+    ):
+        """The Ingress is not re-read if it already has an ingress assigned."""
+
+        simple_ingress.status = client.V1IngressStatus(
+            load_balancer=client.V1IngressLoadBalancerStatus(
+                ingress=[client.V1IngressLoadBalancerIngress(ip="10.0.0.1")],
+            ),
+        )
+        ingress = Ingress(simple_ingress)
+
+        refreshed = []
+        monkeypatch.setattr(ingress, "refresh", lambda: refreshed.append(True))
+
+        ingress.wait_for_load_balancer_ingress(timeout=1)
+        assert not refreshed
+
+    def test_wait_for_load_balancer_ingress(self, monkeypatch, simple_ingress):
+        """The Ingress is re-read until it has an ingress assigned."""
+
+        ingress = Ingress(simple_ingress)
+
+        def refresh():
+            ingress.obj = client.V1Ingress(
+                status=client.V1IngressStatus(
+                    load_balancer=client.V1IngressLoadBalancerStatus(
+                        ingress=[client.V1IngressLoadBalancerIngress(ip="10.0.0.1")],
+                    ),
+                ),
+            )
+
+        monkeypatch.setattr(ingress, "refresh", refresh)
+
+        ingress.wait_for_load_balancer_ingress(timeout=1)
+        assert ingress.has_load_balancer_ingress()
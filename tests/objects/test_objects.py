@@ -0,0 +1,20 @@
+"""Unit tests for the kubetest.objects package."""
+
+import pytest
+
+from kubetest import objects
+
+
+@pytest.mark.parametrize("name", objects.__all__)
+def test_wrappers(name):
+    """Test that each exported wrapper can be accessed from the package."""
+
+    wrapper = getattr(objects, name)
+    assert wrapper.__name__ == name
+
+
+def test_unknown_attribute():
+    """Test accessing an attribute which the package does not export."""
+
+    with pytest.raises(AttributeError):
+        objects.NotAWrapper
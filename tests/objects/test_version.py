@@ -0,0 +1,38 @@
+"""Unit tests for the kubetest.objects.version module."""
+
+import pytest
+from kubernetes import client
+
+from kubetest.objects import Version
+
+
+@pytest.mark.parametrize(
+    "minor,digit_only,expected",
+    [
+        ("28", False, ("1", "28")),
+        ("28", True, ("1", "28")),
+        ("28+", False, ("1", "28+")),
+        ("28+", True, ("1", "28")),
+        ("+", True, ("1", "")),
+    ],
+)
+def test_major_minor_version(monkeypatch, minor, digit_only, expected):
+    """Test getting the major and minor version of the cluster."""
+
+    monkeypatch.setattr(
+        Version,
+        "get_version_code",
+        lambda self: client.VersionInfo(
+            build_date="",
+            compiler="",
+            git_commit="",
+            git_tree_state="",
+            git_version=f"v1.{minor}",
+            go_version="",
+            major="1",
+            minor=minor,
+            platform="",
+        ),
+    )
+
+    assert Version().major_minor_version(digit_only=digit_only) == expected
@@ -0,0 +1,156 @@
+"""Unit tests for the kubetest.objects.workload module."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from kubernetes import client
+
+from kubetest.objects import Deployment, workload
+
+
+@pytest.fixture()
+def deployment(simple_deployment):
+    simple_deployment.metadata.namespace = "test-ns"
+    deployment = Deployment(simple_deployment)
+    # Select pods by the workload spec selector rather than the kubetest label.
+    deployment.klabel_key = None
+    deployment.klabel_uid = None
+    return deployment
+
+
+class TestGetPods:
+    def test_core_api_reused(self, deployment):
+        """The CoreV1Api used to list pods is only created once."""
+
+        with patch.object(client, "CoreV1Api") as core_api:
+            core_api.return_value.list_namespaced_pod.return_value = client.V1PodList(
+                items=[]
+            )
+            assert deployment.get_pods() == []
+            assert deployment.get_pods() == []
+
+        core_api.assert_called_once_with(api_client=deployment.raw_api_client)
+        assert core_api.return_value.list_namespaced_pod.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "label_selector,expected",
+    [
+        (client.V1LabelSelector(match_labels={"app": "nginx"}), "app=nginx"),
+        (
+            client.V1LabelSelector(
+                match_expressions=[
+                    client.V1LabelSelectorRequirement(
+                        key="tier", operator="In", values=["web", "api"]
+                    ),
+                    client.V1LabelSelectorRequirement(
+                        key="env", operator="NotIn", values=["prod"]
+                    ),
+                    client.V1LabelSelectorRequirement(key="app", operator="Exists"),
+                    client.V1LabelSelectorRequirement(
+                        key="canary", operator="DoesNotExist"
+                    ),
+                ]
+            ),
+            "tier in (web,api),env notin (prod),app,!canary",
+        ),
+        (
+            client.V1LabelSelector(
+                match_labels={"app": "nginx"},
+                match_expressions=[
+                    client.V1LabelSelectorRequirement(
+                        key="tier", operator="In", values=["web"]
+                    ),
+                ],
+            ),
+            "app=nginx,tier in (web)",
+        ),
+        (client.V1LabelSelector(), None),
+    ],
+)
+def test_get_pods_label_selector(deployment, label_selector, expected):
+    """The label selector used to list pods is built from the workload selector."""
+
+    deployment.obj.spec.selector = label_selector
+    deployment._core_api = Mock()
+    deployment._core_api.list_namespaced_pod.return_value = client.V1PodList(items=[])
+
+    deployment.get_pods()
+
+    deployment._core_api.list_namespaced_pod.assert_called_once_with(
+        namespace="test-ns", label_selector=expected
+    )
+
+
+def test_get_pods_unknown_operator(deployment):
+    """Match expressions with an unknown operator are skipped."""
+
+    deployment.obj.spec.selector = client.V1LabelSelector(
+        match_labels={"app": "nginx"},
+        match_expressions=[
+            client.V1LabelSelectorRequirement(key="tier", operator="Gt", values=["1"])
+        ],
+    )
+    deployment._core_api = Mock()
+    deployment._core_api.list_namespaced_pod.return_value = client.V1PodList(items=[])
+
+    deployment.get_pods()
+
+    deployment._core_api.list_namespaced_pod.assert_called_once_with(
+        namespace="test-ns", label_selector="app=nginx"
+    )
+
+
+def test_selector_cached():
+    """Selector strings are cached for the same labels."""
+
+    workload._selector_cached.cache_clear()
+
+    first = workload._selector_cached((("app", "nginx"), ("tier", "web")))
+    second = workload._selector_cached((("app", "nginx"), ("tier", "web")))
+
+    assert first == second == "app=nginx,tier=web"
+    assert workload._selector_cached.cache_info().hits == 1
+
+
+def test_get_pods_selector_cached(deployment):
+    """The spec selector string is only rebuilt when the spec selector changes."""
+
+    deployment._core_api = Mock()
+    deployment._core_api.list_namespaced_pod.return_value = client.V1PodList(items=[])
+
+    with patch.object(
+        workload, "_label_selector_parts", wraps=workload._label_selector_parts
+    ) as parts:
+        deployment.get_pods()
+        deployment.get_pods()
+        assert parts.call_count == 1
+
+        deployment.obj.spec.selector = client.V1LabelSelector(
+            match_labels={"app": "other"}
+        )
+        deployment.get_pods()
+        assert parts.call_count == 2
+
+    deployment._core_api.list_namespaced_pod.assert_called_with(
+        namespace="test-ns", label_selector="app=other"
+    )
+
+
+def test_get_pods_klabel_selector_cached(simple_deployment):
+    """The kubetest label selector string is cached across get_pods calls."""
+
+    simple_deployment.metadata.namespace = "test-ns"
+    deployment = Deployment(simple_deployment)
+    deployment._core_api = Mock()
+    deployment._core_api.list_namespaced_pod.return_value = client.V1PodList(items=[])
+    workload._selector_cached.cache_clear()
+
+    deployment.get_pods()
+    deployment.get_pods()
+
+    assert workload._selector_cached.cache_info().hits == 1
+    deployment._core_api.list_namespaced_pod.assert_called_with(
+        namespace="test-ns",
+        label_selector=f"{deployment.klabel_key}={deployment.klabel_uid}",
+    )
@@ -300,6 +300,17 @@ class TestLoadPath:
         for obj in objs:
             assert obj.kind in ["Deployment", "ConfigMap", "Service"]
 
+    def test_context_objs(self, manifest_dir):
+        """Test that loaded objects are made available to the render context."""
+
+        renderer = manifest.ContextRenderer(context={})
+        objs = manifest.load_path(
+            os.path.join(manifest_dir, "manifests"), renderer=renderer
+        )
+
+        assert renderer.context["objs"] is objs
+        assert len(renderer.context["objs"]) == 3
+
     def test_no_dir(self):
         """Test loading manifests when the specified path is not a directory."""
 
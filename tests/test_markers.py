@@ -0,0 +1,297 @@
+"""Unit tests for the kubetest.markers package."""
+
+import os
+
+import pytest
+from kubernetes import client
+
+from kubetest import manifest, markers
+from kubetest.objects import ApiObject, ConfigMap, Deployment, Service
+
+
+class TestGetKindToClass:
+    """Tests for kubetest.markers._get_kind_to_class"""
+
+    def test_maps_kinds_to_wrappers(self):
+        """Test that resource kinds map to their kubetest wrapper classes."""
+
+        kind_to_class = markers._get_kind_to_class()
+
+        assert kind_to_class["ConfigMap"] is ConfigMap
+        assert kind_to_class["Service"] is Service
+        assert kind_to_class["Deployment"] is Deployment
+
+    def test_cached(self):
+        """Test that the mapping is only built once."""
+
+        assert markers._get_kind_to_class() is markers._get_kind_to_class()
+
+    def test_invalidate(self):
+        """Test that invalidating the cache causes the mapping to be rebuilt."""
+
+        first = markers._get_kind_to_class()
+        markers._invalidate_kind_cache()
+        second = markers._get_kind_to_class()
+
+        assert first is not second
+        assert first == second
+
+    def test_nested_subclass(self):
+        """Test that wrappers more than two levels below ApiObject are found."""
+
+        class NestedDeployment(Deployment):
+            pass
+
+        markers._invalidate_kind_cache()
+        try:
+            kind_to_class = markers._get_kind_to_class()
+            assert kind_to_class["NestedDeployment"] is NestedDeployment
+        finally:
+            markers._invalidate_kind_cache()
+
+
+def test_kubetest_wrappers_unique():
+    """Test that each kubetest wrapper class is only defined once.
+
+    A duplicated wrapper module would define multiple classes for the same kind,
+    making the kind lookup for manifests ambiguous.
+    """
+
+    markers._get_kind_to_class()
+
+    names = [
+        c.__name__
+        for c in markers._iter_all_subclasses(ApiObject)
+        if c.__module__.startswith("kubetest.objects.")
+    ]
+    assert len(names) == len(set(names))
+
+
+def test_iter_all_subclasses():
+    """Test iterating over all transitive subclasses of a class."""
+
+    class A:
+        pass
+
+    class B(A):
+        pass
+
+    class C(B):
+        pass
+
+    class D(C, B):
+        pass
+
+    actual = list(markers._iter_all_subclasses(A))
+    assert len(actual) == 3
+    assert set(actual) == {B, C, D}
+
+
+def test_get_default_rbac_subjects():
+    """Test getting the default RBAC subjects for a namespace."""
+
+    subjects = markers.get_default_rbac_subjects("test-ns")
+
+    assert [(s.name, s.kind) for s in subjects] == [
+        ("system:authenticated", "Group"),
+        ("system:unauthenticated", "Group"),
+        ("system:serviceaccounts", "Group"),
+    ]
+    for s in subjects:
+        assert s.namespace == "test-ns"
+        assert s.api_group == "rbac.authorization.k8s.io"
+
+
+class TestLoadFile:
+    """Tests for kubetest.markers._load_file"""
+
+    @pytest.fixture()
+    def calls(self, monkeypatch):
+        """Record the paths of the manifests which are parsed."""
+
+        calls = []
+
+        def load_file(path, renderer):
+            calls.append(path)
+            return manifest.load_file(path, renderer=renderer)
+
+        monkeypatch.setattr(markers, "load_file", load_file)
+        markers._cached_load.cache_clear()
+        return calls
+
+    def test_cached(self, manifest_dir, calls):
+        """Test that an unrendered manifest is only parsed once across contexts."""
+
+        path = os.path.join(manifest_dir, "simple-deployment.yaml")
+        first = markers._load_file(path, manifest.render, {"namespace": "test-1"})
+        second = markers._load_file(path, manifest.render, {"namespace": "test-2"})
+
+        assert len(calls) == 1
+        assert first == second
+        # The cached objects are copied, so callers can not modify them.
+        assert first[0] is not second[0]
+
+    def test_custom_renderer(self, manifest_dir, calls):
+        """Test that manifests rendered by a custom renderer are not cached."""
+
+        def renderer(template, context):
+            return template
+
+        path = os.path.join(manifest_dir, "simple-deployment.yaml")
+        markers._load_file(path, renderer, {"namespace": "test"})
+        markers._load_file(path, renderer, {"namespace": "test"})
+
+        assert len(calls) == 2
+
+    def test_module_renderer(self, manifest_dir, calls, monkeypatch):
+        """Test that manifests rendered by the module renderer are not cached."""
+
+        monkeypatch.setattr(manifest, "__render__", lambda template, context: template)
+
+        path = os.path.join(manifest_dir, "simple-deployment.yaml")
+        markers._load_file(path, manifest.render, {"namespace": "test"})
+        markers._load_file(path, manifest.render, {"namespace": "test"})
+
+        assert len(calls) == 2
+
+
+def test_wrap_objects(simple_deployment, simple_service):
+    """Test wrapping Kubernetes API objects in their kubetest wrappers."""
+
+    wrapped = markers._wrap_objects([simple_deployment, simple_service])
+
+    assert [type(w) for w in wrapped] == [Deployment, Service]
+    assert wrapped[0].obj is simple_deployment
+    assert wrapped[1].obj is simple_service
+
+
+def test_wrap_objects_no_wrapper():
+    """Test wrapping a Kubernetes API object which has no kubetest wrapper."""
+
+    with pytest.raises(ValueError):
+        markers._wrap_objects([client.V1Binding(kind="Binding", target=None)])
+
+
+class FakeMeta:
+    """A stand-in for the TestMeta a marker registers objects with."""
+
+    def __init__(self, ns="test-ns", node_id="test_markers.py::test", name="test"):
+        self.ns = ns
+        self.node_id = node_id
+        self.name = name
+        self.objects = []
+
+    def register_objects(self, api_objects):
+        self.objects.extend(api_objects)
+
+
+class FakeItem:
+    """A stand-in for a pytest test item with the given marks."""
+
+    fspath = __file__
+
+    def __init__(self, *marks):
+        self.marks = [m.mark for m in marks]
+
+    def iter_markers(self, name):
+        return (m for m in self.marks if m.name == name)
+
+    def get_closest_marker(self, name):
+        return next(self.iter_markers(name), None)
+
+
+class TestApplyManifestsFromMarker:
+    """Tests for kubetest.markers.apply_manifests_from_marker"""
+
+    @pytest.mark.parametrize("expose_objs", [False, True])
+    def test_ok(self, expose_objs):
+        """Test loading and registering the manifests in a directory."""
+
+        contexts = []
+
+        def renderer(template, context):
+            contexts.append(dict(context))
+            return template
+
+        markers._cached_load.cache_clear()
+        meta = FakeMeta()
+        item = FakeItem(
+            pytest.mark.applymanifests(
+                "data/manifests", renderer=renderer, expose_objs=expose_objs
+            )
+        )
+        markers.apply_manifests_from_marker(item, meta)
+
+        assert len(meta.objects) == 3
+        assert len(contexts) == 3
+        assert all(("objs" in c) is expose_objs for c in contexts)
+
+    def test_cached(self, monkeypatch):
+        """Test that unrendered manifests are only parsed once across test cases."""
+
+        calls = []
+
+        def load_file(path, renderer):
+            calls.append(path)
+            return manifest.load_file(path, renderer=renderer)
+
+        monkeypatch.setattr(markers, "load_file", load_file)
+        markers._cached_load.cache_clear()
+
+        item = FakeItem(pytest.mark.applymanifests("data/manifests"))
+        # Each test case has its own namespace and node id.
+        for i in range(2):
+            meta = FakeMeta(ns=f"kubetest-{i}", node_id=f"test_markers.py::test[{i}]")
+            markers.apply_manifests_from_marker(item, meta)
+            assert len(meta.objects) == 3
+
+        assert len(calls) == 3
+        assert markers._cached_load.cache_info().hits == 3
+
+
+def test_rolebindings_from_marker():
+    """Test creating RoleBindings from the rolebinding markers of a test item."""
+
+    item = FakeItem(pytest.mark.rolebinding("Role", "test-role"))
+    item.name = "test"
+
+    rolebindings = markers.rolebindings_from_marker(item, "test-ns")
+
+    assert len(rolebindings) == 1
+    obj = rolebindings[0].obj
+    assert obj.metadata.name == "kubetest:test"
+    assert obj.metadata.namespace == "test-ns"
+    assert (
+        obj.role_ref.to_dict()
+        == client.V1RoleRef(
+            api_group="rbac.authorization.k8s.io", kind="Role", name="test-role"
+        ).to_dict()
+    )
+    assert [s.name for s in obj.subjects] == [
+        "system:authenticated",
+        "system:unauthenticated",
+        "system:serviceaccounts",
+    ]
+
+
+def test_clusterrolebindings_from_marker():
+    """Test that each ClusterRoleBinding gets its own default RBAC subjects."""
+
+    item = FakeItem(
+        pytest.mark.clusterrolebinding("cluster-admin"),
+        pytest.mark.clusterrolebinding("view"),
+    )
+    item.name = "test"
+
+    first, second = markers.clusterrolebindings_from_marker(item, "test-ns")
+
+    assert first.obj.role_ref.name == "cluster-admin"
+    assert second.obj.role_ref.name == "view"
+    for crb in (first, second):
+        assert [s.name for s in crb.obj.subjects] == [
+            "system:authenticated",
+            "system:unauthenticated",
+            "system:serviceaccounts",
+        ]
+        assert all(s.namespace is None for s in crb.obj.subjects)
+    assert not any(a is b for a, b in zip(first.obj.subjects, second.obj.subjects))